@@ -204,7 +204,13 @@ class ProximableFunctional(Functional):
            \mathbf{\text{prox}}_{\sigma f^\ast}(\mathbf{z})= \mathbf{z}- \sigma \mathbf{\text{prox}}_{f/\sigma}(\mathbf{z}/\sigma).
 
         """
-        return z - sigma * self.prox(x=z / sigma, tau=1 / sigma)
+        x = z / sigma
+        y = self.prox(x=x, tau=1 / sigma)
+        if isinstance(x, np.ndarray) and isinstance(y, np.ndarray) and x.shape == y.shape and \
+                x.dtype == np.result_type(x, y) and (y is x or not np.may_share_memory(x, y)):
+            np.multiply(y, sigma, out=x)
+            return np.subtract(z, x, out=x)
+        return z - sigma * y
 
     def shifter(self, shift: Union[Number, np.ndarray]) -> 'ProxFuncPreComp':
         r"""
@@ -252,6 +258,9 @@ class ProximableFunctional(Functional):
 
 class ProxFuncPostComp(ProximableFunctional):
     def __init__(self, prox_func: ProximableFunctional, scale: Number, shift: Number):
+        if isinstance(prox_func, ProxFuncPostComp):
+            # Fold nested postcompositions: a * (b * f + c) + d = (a * b) * f + (a * c + d).
+            prox_func, scale, shift = prox_func.prox_func, scale * prox_func.scale, scale * prox_func.shift + shift
         super(ProxFuncPostComp, self).__init__(dim=prox_func.dim, data=prox_func.data,
                                                is_differentiable=prox_func.is_differentiable)
         self.prox_func = prox_func
@@ -271,32 +280,55 @@ class ProxFuncAffineSum(ProximableFunctional):
             raise TypeError('Invalid affine sum.')
         super(ProxFuncAffineSum, self).__init__(dim=prox_func.dim, data=prox_func.data,
                                                 is_differentiable=prox_func.is_differentiable)
+        from pycsou.func.base import ExplicitLinearFunctional
+
+        if isinstance(linear_part, ExplicitLinearFunctional):
+            linear_vec = linear_part.vec
+        else:
+            linear_vec = linear_part.todense().mat.reshape(-1)
+        if isinstance(prox_func, ProxFuncAffineSum):
+            # Fold nested affine sums into a single linear part, so that the prox shifts its input only once.
+            linear_vec = prox_func.linear_vec + linear_vec
+            linear_part = ExplicitLinearFunctional(linear_vec, dtype=linear_vec.dtype)
+            prox_func, intercept = prox_func.prox_func, prox_func.intercept + intercept
         self.prox_func = prox_func
         self.linear_part = linear_part
+        self.linear_vec = linear_vec
         self.intercept = intercept
 
     def __call__(self, x: Union[Number, np.ndarray]) -> Number:
         return self.prox_func.__call__(x) + self.linear_part.__call__(x) + self.intercept
 
     def prox(self, x: Union[Number, np.ndarray], tau: Number) -> Union[Number, np.ndarray]:
-        a = self.linear_part.todense().mat.reshape(-1)
-        return self.prox_func.prox(x - tau * a, tau)
+        return self.prox_func.prox(x - tau * self.linear_vec, tau)
 
 
 class ProxFuncPreComp(ProximableFunctional):
     def __init__(self, prox_func: ProximableFunctional, scale: Union[Number, np.ndarray],
                  shift: Union[Number, np.ndarray]):
+        if isinstance(prox_func, ProxFuncPreComp):
+            # Fold nested precompositions: f(a * (b * x + c) + d) = f((a * b) * x + (a * c + d)).
+            prox_func, scale, shift = prox_func.prox_func, prox_func.scale * scale, \
+                                      prox_func.scale * shift + prox_func.shift
         super(ProxFuncPreComp, self).__init__(dim=prox_func.dim, data=prox_func.data,
                                               is_differentiable=prox_func.is_differentiable)
         self.prox_func = prox_func
         self.scale = scale
         self.shift = shift
+        self.is_unit_scale = isinstance(scale, Number) and scale == 1
+        self.is_null_shift = isinstance(shift, Number) and shift == 0
+
+    def precompose(self, x: Union[Number, np.ndarray]) -> Union[Number, np.ndarray]:
+        y = x if self.is_unit_scale else self.scale * x
+        return y if self.is_null_shift else y + self.shift
 
     def __call__(self, x: Union[Number, np.ndarray]) -> Number:
-        return self.prox_func.__call__(self.scale * x + self.shift)
+        return self.prox_func.__call__(self.precompose(x))
 
     def prox(self, x: Union[Number, np.ndarray], tau: Number) -> Union[Number, np.ndarray]:
-        return (self.prox_func.prox(self.scale * x + self.shift, tau * (self.scale ** 2)) - self.shift) / self.scale
+        y = self.prox_func.prox(self.precompose(x), tau if self.is_unit_scale else tau * (self.scale ** 2))
+        y = y if self.is_null_shift else y - self.shift
+        return y if self.is_unit_scale else y / self.scale
 
 
 class ProxFuncPreCompUnitOp(ProximableFunctional):
@@ -307,7 +339,7 @@ class ProxFuncPreCompUnitOp(ProximableFunctional):
         self.unitary_op = unitary_op
 
     def __call__(self, x: Union[Number, np.ndarray]) -> Number:
-        return self.prox_func.__call__(self.unitary_op.matvec(x))
+        return self.prox_func.__call__(self.unitary_op.__call__(x))
 
     def prox(self, x: Union[Number, np.ndarray], tau: Number) -> Union[Number, np.ndarray]:
-        return self.unitary_op.adjoint(self.prox_func.prox(self.unitary_op.matvec(x), tau=tau))
+        return self.unitary_op.adjoint(self.prox_func.prox(self.unitary_op.__call__(x), tau=tau))
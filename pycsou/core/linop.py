@@ -10,12 +10,13 @@ Abstract classes for multidimensional linear maps.
 
 from pycsou.core.map import DifferentiableMap, DiffMapSum, DiffMapComp, Map, MapSum, MapComp
 import numpy as np
-from typing import Union, Tuple, Optional
+from typing import Union, Tuple, Optional, Callable
 from abc import abstractmethod
 from numbers import Number
 import pylops
 from pylops.optimization.leastsquares import NormalEquationsInversion
 import scipy.sparse.linalg as spls
+from pycsou.util.misc import accumulate_all
 
 
 class LinearOperator(DifferentiableMap):
@@ -24,6 +25,46 @@ class LinearOperator(DifferentiableMap):
 
     Any instance/subclass of this class must at least implement the abstract methods ``__call__`` and ``adjoint``.
 
+    Examples
+    --------
+
+    .. testsetup::
+
+       import numpy as np
+       from pycsou.core.linop import UnitaryOperator
+       from pycsou.linop.base import DenseLinearOperator, IdentityOperator
+
+       class Flip(UnitaryOperator):
+           def __call__(self, x):
+               return x[::-1]
+
+           def adjoint(self, y):
+               return y[::-1]
+
+    Compositions of an operator with its adjoint are symmetric, and reduce to the identity for unitary operators:
+
+    .. doctest::
+
+       >>> U = Flip(size=3)
+       >>> isinstance(U.H * U, IdentityOperator)
+       True
+       >>> A = DenseLinearOperator(np.arange(6).reshape(3, 2))
+       >>> (A.H * A).is_symmetric, (A * A.H).is_symmetric
+       (True, True)
+
+    Powers of a symmetric operator are symmetric, but compositions of two distinct symmetric operators need not be:
+
+    .. doctest::
+
+       >>> L = DenseLinearOperator(np.array([[1., 0.], [0., 2.]]), is_symmetric=True)
+       >>> M = DenseLinearOperator(np.array([[0., 1.], [1., 0.]]), is_symmetric=True)
+       >>> (L ** 3).is_symmetric
+       True
+       >>> (L * M).is_symmetric
+       False
+       >>> np.allclose((L * M).todense().mat, (L * M).todense().mat.T)
+       False
+
     Notes
     -----
     This class supports the following arithmetic operators ``+``, ``-``, ``*``, ``@``, ``**`` and ``/``, implemented with the
@@ -64,11 +105,20 @@ class LinearOperator(DifferentiableMap):
         self.is_dask = is_dask
         self.is_symmetric = is_symmetric
         self.is_square = True if shape[0] == shape[1] else False
+        self._derived_ops = {}
 
     def matvec(self, x: Union[Number, np.ndarray]) -> Union[Number, np.ndarray]:
         r"""Alias for ``self.__call__`` to comply with Scipy's interface."""
         return self.__call__(x)
 
+    def matmat(self, arr: np.ndarray) -> np.ndarray:
+        r"""Apply the operator to the columns of ``arr`` with ``self.apply_along_axis`` to comply with Scipy's interface."""
+        return self.apply_along_axis(arr, axis=0).reshape(self.shape[0], -1)
+
+    def rmatmat(self, arr: np.ndarray) -> np.ndarray:
+        r"""Apply the adjoint to the columns of ``arr`` with ``self.H.apply_along_axis`` to comply with Scipy's interface."""
+        return self.H.apply_along_axis(arr, axis=0).reshape(self.shape[1], -1)
+
     @abstractmethod
     def adjoint(self, y: Union[Number, np.ndarray]) -> Union[Number, np.ndarray]:
         r"""
@@ -123,7 +173,7 @@ class LinearOperator(DifferentiableMap):
         if self.is_symmetric is True:
             return self
         else:
-            return AdjointLinearOperator(self)
+            return self._get_derived_op('adjoint', AdjointLinearOperator)
 
     @property
     def H(self):
@@ -144,7 +194,7 @@ class LinearOperator(DifferentiableMap):
         For real-valued operators, the adjoint and the transpose coincide. For complex-valued operators, we can define the
         transpose as :math:`\mathbf{A}^T \mathbf{y}=\overline{\mathbf{A}^\ast \overline{\mathbf{y}}}`.
         """
-        return TransposeLinearOperator(self)
+        return self._get_derived_op('transpose', TransposeLinearOperator)
 
     @property
     def T(self):
@@ -161,7 +211,8 @@ class LinearOperator(DifferentiableMap):
         :py:class:`~pycsou.core.linop.SymmetricLinearOperator`
             The Range-Gram operator.
         """
-        return SymmetricLinearOperator(self * self.H)
+        return self._get_derived_op('range_gram', lambda LinOp: SymmetricLinearOperator(LinOp * LinOp.H),
+                                    lipschitz_power=2)
 
     @property
     def DomainGram(self):
@@ -173,7 +224,19 @@ class LinearOperator(DifferentiableMap):
         :py:class:`~pycsou.core.linop.SymmetricLinearOperator`
             The Domain-Gram operator.
         """
-        return SymmetricLinearOperator(self.H * self)
+        return self._get_derived_op('domain_gram', lambda LinOp: SymmetricLinearOperator(LinOp.H * LinOp),
+                                    lipschitz_power=2)
+
+    def _get_derived_op(self, key: str, builder: Callable[['LinearOperator'], 'LinearOperator'],
+                        lipschitz_power: Optional[int] = 1) -> 'LinearOperator':
+        # Set ``lipschitz_power=None`` for derived operators (e.g. Scipy/Pylops wrappers) without a Lipschitz constant.
+        derived_op = self._derived_ops.get(key)
+        if derived_op is None:
+            derived_op = self._derived_ops[key] = builder(self)
+        elif lipschitz_power is not None and derived_op.lipschitz_cst == np.infty and self.lipschitz_cst != np.infty:
+            # The Lipschitz constant of self may have been computed since the derived operator was built.
+            derived_op.lipschitz_cst = derived_op.diff_lipschitz_cst = self.lipschitz_cst ** lipschitz_power
+        return derived_op
 
     def eigenvals(self, k: int, which='LM', **kwargs: dict) -> np.ndarray:
         r"""
@@ -243,12 +306,20 @@ class LinearOperator(DifferentiableMap):
 
         kwargs: dict
             A dict of additional keyword arguments values accepted by Scipy's function :py:func:`scipy.sparse.linalg.svds`.
+            Setting ``solver='power'`` computes the largest singular value (``k=1``, ``which='LM'``) by power iterations
+            instead, which accept the optional keyword arguments ``tol``, ``maxiter`` and ``seed``
+            (see :py:func:`~pycsou.core.linop.power_iteration`).
 
         Returns
         -------
         np.ndarray
             Array containing the ``k`` requested singular values.
 
+        Raises
+        ------
+        ValueError
+            If ``solver='power'`` and ``k!=1`` or ``which!='LM'``, or ``maxiter < 1``.
+
         Examples
         --------
         .. testsetup::
@@ -264,6 +335,8 @@ class LinearOperator(DifferentiableMap):
            >>> ConvOp = Convolve1D(size=sig.size, filter=filter)
            >>> np.round((ConvOp.singularvals(k=3, which='LM', tol=1e-3)), 2)
            array([0.5, 0.5, 0.5])
+           >>> np.round((ConvOp.singularvals(k=1, which='LM', solver='power', tol=1e-6)), 2)
+           array([0.5])
 
         Notes
         -----
@@ -274,26 +347,51 @@ class LinearOperator(DifferentiableMap):
         --------
         :py:meth:`~pycsou.core.linop.LinearOperator.eigenvals`
         """
+        if kwargs.get('solver') == 'power':
+            if k != 1 or which != 'LM':
+                raise ValueError("Power iterations only compute the largest singular value (k=1, which='LM').")
+            if kwargs.get('maxiter', 1) < 1:
+                raise ValueError('The maximal number of iterations must be at least 1.')
+            kwargs.pop('solver')
+            return np.array([power_iteration(self, **kwargs)])
         return spls.svds(A=self.SciOp, k=k, which=which, return_singular_vectors=False, **kwargs)
 
-    def compute_lipschitz_cst(self, **kwargs):
+    def compute_lipschitz_cst(self, single_precision: bool = False, **kwargs):
         r"""
         Compute the Lipschitz constant of the operator.
 
         Parameters
         ----------
+        single_precision: bool
+            If ``True``, ARPACK's work arrays are stored in single precision, which halves their memory footprint.
+            The resulting estimate is stored in double precision. Only applies to the ARPACK paths, and cannot be combined
+            with ``solver='power'``.
         kwargs: dict
-            A dict of additional keyword arguments values accepted by Scipy's functions :py:func:`scipy.sparse.linalg.eigs`,
-            :py:func:`scipy.sparse.linalg.eigsh`, :py:func:`scipy.sparse.linalg.svds`.
+            A dict of additional keyword arguments values accepted by Scipy's function :py:func:`scipy.sparse.linalg.eigsh`,
+            which is used for both symmetric and non symmetric operators. Setting ``solver='power'`` uses power iterations
+            instead (see :py:meth:`~pycsou.core.linop.LinearOperator.singularvals`).
 
         Returns
         -------
         None
             Nothing: The Lipschitz constant is stored in the attribute ``self.lipschitz_cst``.
 
+        Raises
+        ------
+        ValueError
+            If ``solver`` is given and is not ``'power'``: the other solvers of :py:func:`scipy.sparse.linalg.svds` are not supported.
+            If ``single_precision=True`` and ``solver='power'``.
+
         Examples
         --------
 
+        .. testsetup::
+
+           import numpy as np
+           from scipy import signal
+           from pycsou.linop.conv import Convolve1D
+           from pycsou.func.base import ExplicitLinearFunctional
+
         .. doctest::
 
            >>> sig = np.repeat([0., 1., 0.], 10)
@@ -302,24 +400,53 @@ class LinearOperator(DifferentiableMap):
            >>> ConvOp.compute_lipschitz_cst(tol=1e-2); np.round(ConvOp.lipschitz_cst,1)
            0.5
 
+        Operators with a single row, such as linear functionals, are supported too:
+
+        .. doctest::
+
+           >>> f = ExplicitLinearFunctional(np.array([3., 4.]))
+           >>> f.compute_lipschitz_cst(); f.lipschitz_cst
+           5.0
+
         Notes
         -----
-        The Lipschtiz constant of a linear operator is its largest singular value. This function therefore calls
-        the methods  ``self.singularvals`` with ``k=1`` and ``which='LM'`` to perform this computation.
+        The Lipschtiz constant of a linear operator is its largest singular value. For symmetric operators, this function
+        therefore calls the method ``self.eigenvals`` with ``k=1`` and ``which='LM'`` to perform this computation.
+        For non symmetric operators, the largest singular value is obtained as the square root of the largest eigenvalue
+        of the smallest of the two Gram operators ``self.RangeGram`` and ``self.DomainGram``, which are symmetric.
 
         Warnings
         --------
         For high-dimensional linear operators this method can be very time-consuming. Reducing the computation accuracy with
-        the optional argument ``tol: float`` may help reduce the computational burden. See Scipy's functions :py:func:`scipy.sparse.linalg.eigs`,
-        :py:func:`scipy.sparse.linalg.eigsh`, :py:func:`scipy.sparse.linalg.svds` for more on this parameter.
+        the optional argument ``tol: float`` may help reduce the computational burden. See Scipy's function
+        :py:func:`scipy.sparse.linalg.eigsh` for more on this parameter.
 
         """
-        if self.is_symmetric is True:
-            self.lipschitz_cst = float(np.abs(self.eigenvals(k=1, **kwargs)))
+        if kwargs.get('solver', 'power') != 'power':
+            raise ValueError(f"Unsupported solver {kwargs['solver']}: only solver='power' is accepted, "
+                             "the other computations rely on scipy.sparse.linalg.eigsh.")
+        if kwargs.get('solver') == 'power':
+            if single_precision is True:
+                raise ValueError("Option single_precision=True is not supported with solver='power'.")
+            self.lipschitz_cst = float(self.singularvals(k=1, which='LM', **kwargs))
+        elif self.is_symmetric is True:
+            self.lipschitz_cst = float(np.abs(self._largest_eigenval(single_precision=single_precision, **kwargs)))
         else:
-            self.lipschitz_cst = float(self.singularvals(k=1, **kwargs))
+            gram = self.RangeGram if self.shape[0] <= self.shape[1] else self.DomainGram
+            if gram.shape[0] == 1:
+                largest_eigenvalue = np.abs(gram(np.ones(shape=(1,), dtype=self.dtype)))
+            else:
+                largest_eigenvalue = np.abs(gram._largest_eigenval(single_precision=single_precision, **kwargs))
+            self.lipschitz_cst = float(np.sqrt(largest_eigenvalue))
         self.diff_lipschitz_cst = self.lipschitz_cst
 
+    def _largest_eigenval(self, single_precision: bool = False, **kwargs) -> np.ndarray:
+        # Only meant for symmetric operators (the operator itself or one of its Gram operators).
+        if single_precision is False:
+            return self.eigenvals(k=1, **kwargs)
+        dtype = np.complex64 if np.iscomplexobj(np.empty(0, dtype=self.dtype)) else np.float32
+        return spls.eigsh(A=self.tosciop(dtype=dtype), k=1, return_eigenvectors=False, **kwargs)
+
     def todense(self) -> 'DenseLinearOperator':
         r"""
         Convert the operator to a :py:class:`~pycsou.linop.base.DenseLinearOperator`.
@@ -331,7 +458,19 @@ class LinearOperator(DifferentiableMap):
         """
         from pycsou.linop.base import DenseLinearOperator
 
-        return DenseLinearOperator(self.PyLop.todense())
+        is_tall = self.shape[1] <= self.shape[0]
+        matmat, size = (self.matmat, self.shape[1]) if is_tall else (self.rmatmat, self.shape[0])
+        block_size = min(size, 256)
+        columns = None
+        for start in range(0, size, block_size):
+            stop = min(start + block_size, size)
+            basis_block = np.zeros(shape=(size, stop - start), dtype=self.dtype)
+            basis_block[np.arange(start, stop), np.arange(stop - start)] = 1
+            block = np.asarray(matmat(basis_block))
+            if columns is None:
+                columns = np.empty(shape=(block.shape[0], size), dtype=block.dtype)
+            columns[:, start:stop] = block
+        return DenseLinearOperator(columns if is_tall else columns.conj().T)
 
     def tosparse(self) -> 'SparseLinearOperator':
         r"""
@@ -346,21 +485,29 @@ class LinearOperator(DifferentiableMap):
 
         return SparseLinearOperator(self.PyLop.tosparse())
 
-    def tosciop(self) -> spls.LinearOperator:
+    def tosciop(self, dtype: Optional[type] = None) -> spls.LinearOperator:
         r"""
         Convert the operator to a Scipy :py:class:`scipy.sparse.linalg.LinearOperator`.
 
+        Parameters
+        ----------
+        dtype: Optional[type]
+            Data type advertised to Scipy, which determines the precision of the work arrays of Scipy's solvers.
+            Defaults to ``self.dtype``.
+
         Returns
         -------
         :py:class:`scipy.sparse.linalg.LinearOperator`
             The Scipy linear operator representation.
         """
-        return spls.LinearOperator(dtype=self.dtype, shape=self.shape, matvec=self.matvec, rmatvec=self.adjoint)
+        dtype = self.dtype if dtype is None else dtype
+        return spls.LinearOperator(dtype=dtype, shape=self.shape, matvec=self.__call__, rmatvec=self.adjoint,
+                                   matmat=self.matmat, rmatmat=self.rmatmat)
 
     @property
     def SciOp(self):
-        r"""Alias for method ``self.tosciop``."""
-        return self.tosciop()
+        r"""Alias for method ``self.tosciop``. The Scipy operator is built once, on first access."""
+        return self._get_derived_op('sciop', lambda LinOp: LinOp.tosciop(), lipschitz_power=None)
 
     def topylop(self) -> pylops.LinearOperator:
         r"""
@@ -375,8 +522,8 @@ class LinearOperator(DifferentiableMap):
 
     @property
     def PyLop(self):
-        r"""Alias for method ``self.topylop``."""
-        return self.topylop()
+        r"""Alias for method ``self.topylop``. The Pylops operator is built once, on first access."""
+        return self._get_derived_op('pylop', lambda LinOp: LinOp.topylop(), lipschitz_power=None)
 
     def cond(self, **kwargs) -> float:
         r"""
@@ -394,7 +541,8 @@ class LinearOperator(DifferentiableMap):
         """
         return self.PyLop.cond(**kwargs)
 
-    def pinv(self, y: Union[Number, np.ndarray], eps: Number = 0, **kwargs) -> Union[Number, np.ndarray]:
+    def pinv(self, y: Union[Number, np.ndarray], eps: Number = 0, solver: str = 'lsmr', **kwargs) \
+            -> Union[Number, np.ndarray]:
         r"""
         Evaluate the pseudo-inverse of the operator at ``y``.
 
@@ -403,21 +551,37 @@ class LinearOperator(DifferentiableMap):
         y: Union[Number, np.ndarray]
             Point at which the pseudo-inverse is evaluated.
         eps: Number
-            Tikhonov damping.
+            Tikhonov damping. As in Pylops, it is applied squared: the pseudo-inverse solves the regularised normal
+            equations :math:`(\mathbf{A}^\ast\mathbf{A}+\text{eps}^2\mathbf{I})\mathbf{x}=\mathbf{A}^\ast\mathbf{y}`.
+        solver: str, [‘lsmr’ | ‘cg’]
+            Iterative solver used to evaluate the pseudo-inverse:
+
+                * ‘lsmr’ : solves the least-squares problem directly with :py:func:`scipy.sparse.linalg.lsmr`,
+                * ‘cg’ : solves the normal equations with :py:func:`pylops.optimization.leastsquares.NormalEquationsInversion`.
+
         kwargs:
-            Arbitrary keyword arguments accepted by the function: :py:func:`pylops.optimization.leastsquares.NormalEquationsInversion`.
+            Arbitrary keyword arguments accepted by the function :py:func:`scipy.sparse.linalg.lsmr` (``solver='lsmr'``) or
+            :py:func:`pylops.optimization.leastsquares.NormalEquationsInversion` (``solver='cg'``). Since the default
+            solver is ‘lsmr’, keyword arguments specific to :py:func:`~pylops.optimization.leastsquares.NormalEquationsInversion`
+            (e.g. ``tol`` or ``x0``) require ``solver='cg'``.
 
         Returns
         -------
         numpy.ndarray
             Evaluation of the pseudo-inverse of the operator at ``y``.
 
+        Raises
+        ------
+        ValueError
+            If ``solver`` is not one of ``'lsmr'`` or ``'cg'``.
+
         Notes
         -----
-        This is a wrapper around the function :py:func:`pylops.optimization.leastsquares.NormalEquationsInversion`. Additional
-        information can be found in the help of this function.
+        Both solvers require one evaluation of the operator and one of its adjoint per iteration. The normal equations
+        however have a condition number which is the square of the operator's, so that LSMR converges in fewer iterations
+        on ill-conditioned operators. Additional information can be found in the help of the two functions above.
         """
-        return NormalEquationsInversion(Op=self.PyLop, Regs=None, data=y, epsI=eps, **kwargs, returninfo=False)
+        return pinv_solve(self.PyLop, data=y, eps=eps, solver=solver, **kwargs)
 
     @property
     def PinvOp(self) -> 'LinOpPinv':
@@ -460,6 +624,10 @@ class LinearOperator(DifferentiableMap):
         if isinstance(other, np.ndarray):
             return self(other)
         elif isinstance(other, LinearOperator):
+            if is_unitary_round_trip(self, other):
+                from pycsou.linop.base import IdentityOperator
+
+                return IdentityOperator(size=other.shape[1], dtype=other.dtype)
             return LinOpComp(self, other)
         elif isinstance(other, DifferentiableMap):
             return DiffMapComp(self, other)
@@ -476,6 +644,10 @@ class LinearOperator(DifferentiableMap):
             other = HomothetyMap(constant=other, size=self.shape[0])
 
         if isinstance(other, LinearOperator):
+            if is_unitary_round_trip(other, self):
+                from pycsou.linop.base import IdentityOperator
+
+                return IdentityOperator(size=self.shape[1], dtype=self.dtype)
             return LinOpComp(other, self)
         elif isinstance(other, DifferentiableMap):
             return DiffMapComp(other, self)
@@ -490,18 +662,23 @@ class AdjointLinearOperator(LinearOperator):
         super(AdjointLinearOperator, self).__init__(shape=(LinOp.shape[1], LinOp.shape[0]), dtype=LinOp.dtype,
                                                     is_explicit=LinOp.is_explicit, is_dask=LinOp.is_dask,
                                                     is_dense=LinOp.is_dense, is_sparse=LinOp.is_sparse,
-                                                    is_symmetric=LinOp.is_symmetric)
+                                                    is_symmetric=LinOp.is_symmetric, lipschitz_cst=LinOp.lipschitz_cst)
         self.Linop = LinOp
 
     def __call__(self, y: Union[Number, np.ndarray]) -> Union[Number, np.ndarray]:
         return self.Linop.adjoint(y)
 
     def adjoint(self, x: Union[Number, np.ndarray]) -> Union[Number, np.ndarray]:
-        return self.Linop.matvec(x)
+        return self.Linop.__call__(x)
+
+    def get_adjointOp(self) -> LinearOperator:
+        # The adjoint of the adjoint is the original operator: do not stack wrappers.
+        return self.Linop
 
     def compute_lipschitz_cst(self, **kwargs: dict):
+        # An operator and its adjoint share the same singular values: reuse the constant whenever it is known.
         if self.Linop.lipschitz_cst != np.infty:
-            self.lipschitz_cst = self.Linop.lipschitz_cst
+            self.lipschitz_cst = self.diff_lipschitz_cst = self.Linop.lipschitz_cst
         else:
             LinearOperator.compute_lipschitz_cst(self, **kwargs)
 
@@ -511,14 +688,23 @@ class TransposeLinearOperator(LinearOperator):
         super(TransposeLinearOperator, self).__init__(shape=(LinOp.shape[1], LinOp.shape[0]), dtype=LinOp.dtype,
                                                       is_explicit=LinOp.is_explicit, is_dask=LinOp.is_dask,
                                                       is_dense=LinOp.is_dense, is_sparse=LinOp.is_sparse,
-                                                      is_symmetric=LinOp.is_symmetric)
+                                                      is_symmetric=LinOp.is_symmetric, lipschitz_cst=LinOp.lipschitz_cst)
         self.Linop = LinOp
 
     def __call__(self, y: Union[Number, np.ndarray]) -> Union[Number, np.ndarray]:
         return self.Linop.adjoint(y.conj()).conj()
 
+    def get_transposeOp(self) -> LinearOperator:
+        return self.Linop
+
     def adjoint(self, x: Union[Number, np.ndarray]) -> Union[Number, np.ndarray]:
-        return self.Linop.matvec(x)
+        return self.Linop.__call__(x)
+
+    def compute_lipschitz_cst(self, **kwargs: dict):
+        if self.Linop.lipschitz_cst != np.infty:
+            self.lipschitz_cst = self.diff_lipschitz_cst = self.Linop.lipschitz_cst
+        else:
+            LinearOperator.compute_lipschitz_cst(self, **kwargs)
 
 
 class LinOpSum(LinearOperator, DiffMapSum):
@@ -532,9 +718,50 @@ class LinOpSum(LinearOperator, DiffMapSum):
                                 is_symmetric=LinOp1.is_symmetric & LinOp2.is_symmetric,
                                 lipschitz_cst=self.lipschitz_cst)
         self.LinOp1, self.LinOp2 = LinOp1, LinOp2
+        self.summand_adjoints = [linop.adjoint for linop in self.summands]
 
     def adjoint(self, y: Union[Number, np.ndarray]) -> Union[Number, np.ndarray]:
-        return self.LinOp1.adjoint(y) + self.LinOp2.adjoint(y)
+        return accumulate_all(adjoint(y) for adjoint in self.summand_adjoints)
+
+
+def is_adjoint_pair(LinOp1: LinearOperator, LinOp2: LinearOperator) -> bool:
+    r"""
+    Check whether ``LinOp1`` is (structurally) the adjoint of ``LinOp2``.
+
+    Parameters
+    ----------
+    LinOp1: LinearOperator
+        Left operand.
+    LinOp2: LinearOperator
+        Right operand.
+
+    Returns
+    -------
+    bool
+        ``True`` if one operator wraps the adjoint of the other, or if both are the same symmetric operator.
+        The compositions ``LinOp1 * LinOp2`` and ``LinOp2 * LinOp1`` are then symmetric.
+    """
+    if LinOp1 is LinOp2:
+        return LinOp1.is_symmetric is True
+    return (isinstance(LinOp1, AdjointLinearOperator) and LinOp1.Linop is LinOp2) or \
+           (isinstance(LinOp2, AdjointLinearOperator) and LinOp2.Linop is LinOp1)
+
+
+def is_symmetric_power(factors: list) -> bool:
+    r"""
+    Check whether the composition of ``factors`` is a power :math:`L^n` of a symmetric operator :math:`L`, which is then
+    symmetric (e.g. ``L ** 3``, stored as the composition of ``L * L`` and ``L``).
+    """
+    return factors[0].is_symmetric is True and all(linop is factors[0] for linop in factors[1:])
+
+
+def is_unitary_round_trip(LinOp1: LinearOperator, LinOp2: LinearOperator) -> bool:
+    r"""
+    Check whether the composition ``LinOp1 * LinOp2`` is of the form :math:`U^\ast U` or :math:`UU^\ast` for some
+    unitary operator :math:`U`, in which case it is the identity.
+    """
+    unitary = LinOp2 if isinstance(LinOp1, AdjointLinearOperator) else LinOp1
+    return isinstance(unitary, UnitaryOperator) and is_adjoint_pair(LinOp1, LinOp2)
 
 
 class LinOpComp(LinearOperator, DiffMapComp):
@@ -545,12 +772,19 @@ class LinOpComp(LinearOperator, DiffMapComp):
                                 is_explicit=LinOp1.is_explicit & LinOp2.is_explicit,
                                 is_dask=LinOp1.is_dask & LinOp2.is_dask, is_dense=LinOp1.is_dense & LinOp2.is_dense,
                                 is_sparse=LinOp1.is_sparse & LinOp2.is_sparse,
-                                is_symmetric=LinOp1.is_symmetric & LinOp2.is_symmetric,
+                                is_symmetric=is_adjoint_pair(LinOp1, LinOp2) or is_symmetric_power(self.factors),
                                 lipschitz_cst=self.lipschitz_cst)
         self.LinOp1, self.LinOp2 = LinOp1, LinOp2
+        self.factor_calls = [linop.Linop.adjoint if isinstance(linop, AdjointLinearOperator) else linop.__call__
+                             for linop in reversed(self.factors)]
+        # The adjoint applies the factors in reverse evaluation order (outermost map first).
+        self.factor_adjoints = [linop.Linop.__call__ if isinstance(linop, AdjointLinearOperator) else linop.adjoint
+                                for linop in self.factors]
 
     def adjoint(self, y: Union[Number, np.ndarray]) -> Union[Number, np.ndarray]:
-        return self.LinOp2.adjoint(self.LinOp1.adjoint(y))
+        for adjoint in self.factor_adjoints:
+            y = adjoint(y)
+        return y
 
 
 class SymmetricLinearOperator(LinearOperator):
@@ -568,7 +802,7 @@ class SymmetricLinearOperator(LinearOperator):
         return self.LinOp.__call__(x)
 
     def adjoint(self, y: Union[Number, np.ndarray]) -> Union[Number, np.ndarray]:
-        return self.__call__(y)
+        return self.LinOp.__call__(y)
 
 
 class UnitaryOperator(LinearOperator):
@@ -583,12 +817,13 @@ class UnitaryOperator(LinearOperator):
 
     @property
     def RangeGram(self):
-        from pycsou.linop.base import IdentityOperator
-
-        return IdentityOperator(size=self.size, dtype=self.dtype)
+        return self._get_derived_op('identity', UnitaryOperator._identity)
 
     @property
     def DomainGram(self):
+        return self._get_derived_op('identity', UnitaryOperator._identity)
+
+    def _identity(self) -> 'IdentityOperator':
         from pycsou.linop.base import IdentityOperator
 
         return IdentityOperator(size=self.size, dtype=self.dtype)
@@ -615,15 +850,149 @@ class UnitaryOperator(LinearOperator):
         return 1
 
 
+def power_iteration(LinOp: LinearOperator, tol: float = 1e-6, maxiter: int = 1000, seed: Optional[int] = 0) -> float:
+    r"""
+    Compute the largest singular value of a linear operator by power iterations.
+
+    Parameters
+    ----------
+    LinOp: LinearOperator
+        Linear operator :math:`\mathbf{A}`.
+    tol: float
+        Relative tolerance on the successive estimates of the squared singular value.
+    maxiter: int
+        Maximal number of iterations. Must be at least 1.
+    seed: Optional[int]
+        Seed of the local random generator drawing the initial vector. The global Numpy random state is left untouched.
+
+    Returns
+    -------
+    float
+        Largest singular value of :math:`\mathbf{A}`.
+
+    Raises
+    ------
+    ValueError
+        If ``maxiter < 1``.
+
+    Notes
+    -----
+    The iterations are performed with the smallest of the two Gram operators :math:`\mathbf{A}^\ast\mathbf{A}` and
+    :math:`\mathbf{A}\mathbf{A}^\ast`, and hence require one evaluation of the operator and one of its adjoint each.
+    Unlike ARPACK, they only ever store a single vector, but converge slowly when the two largest singular values are close.
+    """
+    if maxiter < 1:
+        raise ValueError('The maximal number of iterations must be at least 1.')
+    if LinOp.shape[0] < LinOp.shape[1]:
+        gram, size = (lambda x: LinOp.__call__(LinOp.adjoint(x))), LinOp.shape[0]
+    else:
+        gram, size = (lambda x: LinOp.adjoint(LinOp.__call__(x))), LinOp.shape[1]
+    rng = np.random.RandomState(seed)
+    x = rng.randn(size)
+    if np.iscomplexobj(np.empty(0, dtype=LinOp.dtype)):
+        x = x + 1j * rng.randn(size)
+    x /= np.linalg.norm(x)
+    sigma2 = 0
+    for _ in range(maxiter):
+        y = gram(x)
+        new_sigma2 = np.linalg.norm(y)
+        if new_sigma2 == 0:
+            return 0.
+        x = y / new_sigma2
+        if np.abs(new_sigma2 - sigma2) <= tol * new_sigma2:
+            break
+        sigma2 = new_sigma2
+    return float(np.sqrt(new_sigma2))
+
+
+def pinv_solve(Op: pylops.LinearOperator, data: Union[Number, np.ndarray], eps: Number = 0, solver: str = 'lsmr',
+               **kwargs) -> Union[Number, np.ndarray]:
+    r"""
+    Evaluate the (Tikhonov-damped) pseudo-inverse of a Pylops operator at ``data``.
+
+    See :py:meth:`~pycsou.core.linop.LinearOperator.pinv` for a description of the parameters.
+    """
+    if solver == 'lsmr':
+        # LSMR allocates its work vectors with the dtype of the data: upcast it for complex operators.
+        dtype = np.result_type(data, Op.dtype)
+        data = np.asarray(data, dtype=dtype)
+        return spls.lsmr(Op, data, damp=eps, **kwargs)[0].astype(dtype, copy=False)
+    elif solver == 'cg':
+        return NormalEquationsInversion(Op=Op, Regs=None, data=data, epsI=eps, **kwargs, returninfo=False)
+    else:
+        raise ValueError(f'Unsupported solver {solver}.')
+
+
 class LinOpPinv(LinearOperator):
-    def __init__(self, LinOp: LinearOperator, eps: Number = 0):
+    def __init__(self, LinOp: LinearOperator, eps: Number = 0, solver: str = 'lsmr'):
+        r"""
+        Parameters
+        ----------
+        LinOp: LinearOperator
+            Linear operator to pseudo-invert.
+        eps: Number
+            Tikhonov damping, applied squared (see :py:meth:`~pycsou.core.linop.LinearOperator.pinv`).
+        solver: str, [‘lsmr’ | ‘cg’ | ‘svd’]
+            Solver used to evaluate the pseudo-inverse and its adjoint. ‘lsmr’ and ‘cg’ are the iterative solvers of
+            :py:meth:`~pycsou.core.linop.LinearOperator.pinv`. ‘svd’ computes a thin SVD of the dense matrix of ``LinOp``
+            on the first evaluation, and reuses it for all subsequent evaluations of both the pseudo-inverse and its
+            adjoint. It is only suitable for small to moderately sized operators.
+
+        Examples
+        --------
+        .. testsetup::
+
+           import numpy as np
+           from pycsou.linop.base import DenseLinearOperator
+           from pycsou.core.linop import LinOpPinv
+
+        .. doctest::
+
+           >>> rng = np.random.RandomState(0)
+           >>> mat = rng.randn(5, 3) + 1j * rng.randn(5, 3)
+           >>> PinvOp = LinOpPinv(DenseLinearOperator(mat), solver='svd')
+           >>> y, x = rng.randn(5), rng.randn(3)
+           >>> np.allclose(PinvOp(y), np.linalg.pinv(mat) @ y)
+           True
+           >>> np.allclose(PinvOp.adjoint(x), np.linalg.pinv(mat).conj().T @ x)
+           True
+        """
+        if solver not in ('lsmr', 'cg', 'svd'):
+            raise ValueError(f'Unsupported solver {solver}.')
         self.LinOp = LinOp
         self.eps = eps
+        self.solver = solver
+        if solver == 'svd':
+            self.svd_factors = None
+        else:
+            self.PyLinOp = LinOp.PyLop
+            self.PyLinOpH = LinOp.H.PyLop
         super(LinOpPinv, self).__init__(shape=LinOp.H.shape, dtype=LinOp.dtype, is_explicit=False, is_dense=False,
                                         is_dask=False, is_symmetric=LinOp.is_symmetric)
 
+    def _svd_factors(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Factors (U, s_inv, Vh) of the pseudo-inverse V diag(s_inv) U^H, computed on the first call.
+        if self.svd_factors is None:
+            U, s, Vh = np.linalg.svd(self.LinOp.todense().mat, full_matrices=False)
+            if self.eps == 0:
+                # Same cutoff on small singular values as scipy.linalg.pinv and np.linalg.matrix_rank.
+                cutoff = np.max(self.LinOp.shape) * np.finfo(s.dtype).eps * np.max(s, initial=0)
+                s_inv = np.divide(1, s, out=np.zeros_like(s), where=s > cutoff)
+            else:
+                s_inv = s / (s ** 2 + self.eps ** 2)
+            self.svd_factors = (U, s_inv, Vh)
+        return self.svd_factors
+
     def __call__(self, x: Union[Number, np.ndarray]) -> Union[Number, np.ndarray]:
-        return NormalEquationsInversion(Op=self.LinOp.PyLop, Regs=None, data=x, epsI=self.eps, returninfo=False)
+        if self.solver == 'svd':
+            U, s_inv, Vh = self._svd_factors()
+            if np.iscomplexobj(U):
+                return np.conj(Vh.transpose().dot(s_inv * U.transpose().dot(np.conj(x))))
+            return Vh.transpose().dot(s_inv * U.transpose().dot(x))
+        return pinv_solve(self.PyLinOp, data=x, eps=self.eps, solver=self.solver)
 
     def adjoint(self, y: Union[Number, np.ndarray]) -> Union[Number, np.ndarray]:
-        return LinOpPinv(LinOp=self.LinOp.H, eps=self.eps).__call__(y)
+        if self.solver == 'svd':
+            U, s_inv, Vh = self._svd_factors()
+            return U.dot(s_inv * Vh.dot(y))
+        return pinv_solve(self.PyLinOpH, data=y, eps=self.eps, solver=self.solver)
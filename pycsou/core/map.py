@@ -14,7 +14,7 @@ import joblib as job
 from abc import ABC, abstractmethod
 from typing import Union, Tuple
 from numbers import Number
-from pycsou.util.misc import is_range_broadcastable, range_broadcast_shape
+from pycsou.util.misc import is_range_broadcastable, range_broadcast_shape, accumulate, accumulate_all
 
 
 class Map(ABC):
@@ -188,10 +188,27 @@ class Map(ABC):
         :py:class:`~pycsou.core.map.MapShifted`
             Shifted map.
 
+        Examples
+        --------
+
+        .. testsetup::
+
+           import numpy as np
+           from pycsou.linop.base import DenseLinearOperator
+
+        .. doctest::
+
+           >>> A = DenseLinearOperator(np.arange(9).reshape(3, 3))
+           >>> x = np.arange(3)
+           >>> np.allclose(A.shifter(2.0)(x), A(x + 2.0))
+           True
+           >>> np.allclose(A.shifter(np.ones(3))(x), A(x + 1))
+           True
+
         Notes
         -----
         Let ``A`` be a ``Map`` instance  and ``B=A.shifter(y)`` with ``y`` some vector in the domain of ``A``. Then we have:
-        ``B(x)=A(x+y)``.
+        ``B(x)=A(x+y)``. Scalar shifts ``y`` are broadcast to all the coordinates of ``x``.
         """
         return MapShifted(map=self, shift=shift)
 
@@ -317,11 +334,21 @@ class Map(ABC):
         return self.__add__(other)
 
     def __pow__(self, power: int) -> 'MapComp':
-        r"""Raise a map to a certain ``power``. Alias for ``A*A*...*A`` with ``power`` multiplications."""
+        r"""
+        Raise a map to a certain ``power``. Alias for ``A*A*...*A`` with ``power`` multiplications.
+
+        The power is computed by repeated squaring, which requires :math:`O(\log(\text{power}))` compositions.
+        """
         if type(power) is int:
-            exp_map = self
-            for i in range(1, power):
-                exp_map = self.__mul__(exp_map)
+            if power <= 1:
+                return self
+            exp_map, base = None, self
+            while power > 0:
+                if power & 1:
+                    exp_map = base if exp_map is None else base.__mul__(exp_map)
+                power >>= 1
+                if power > 0:
+                    base = base.__mul__(base)
             return exp_map
         else:
             raise NotImplementedError
@@ -336,14 +363,21 @@ class Map(ABC):
 
 class MapShifted(Map):
     def __init__(self, map: Map, shift: Union[Number, np.ndarray]):
+        if not isinstance(shift, Number) and shift.size != map.shape[1]:
+            raise TypeError('Invalid shift size.')
+        if isinstance(map, MapShifted):
+            # Fold nested shifts: A.shifter(a).shifter(b)(x) = A(x + b + a).
+            map, shift = map.map, map.shift + shift
         self.map = map
         self.shift = shift
-        if shift.size != map.shape[1]:
-            raise TypeError('Invalid shift size.')
+        self.is_null_shift = isinstance(shift, Number) and shift == 0
         Map.__init__(self, shape=map.shape, is_linear=map.is_linear, is_differentiable=map.is_differentiable)
 
+    def shifted(self, arg: Union[Number, np.ndarray]) -> Union[Number, np.ndarray]:
+        return arg if self.is_null_shift else arg + self.shift
+
     def __call__(self, arg: Union[Number, np.ndarray]) -> Union[Number, np.ndarray]:
-        return self.map(arg + self.shift)
+        return self.map(self.shifted(arg))
 
 
 class MapSum(Map):
@@ -355,9 +389,13 @@ class MapSum(Map):
                          is_linear=map1.is_linear & map2.is_linear,
                          is_differentiable=map1.is_differentiable & map2.is_differentiable)
             self.map1, self.map2 = map1, map2
+            self.summands = []
+            for map_ in (map1, map2):
+                self.summands.extend(map_.summands if isinstance(map_, MapSum) else [map_])
+            self.summand_calls = [map_.__call__ for map_ in self.summands]
 
     def __call__(self, arg: Union[Number, np.ndarray]) -> Union[Number, np.ndarray]:
-        return self.map1(arg) + self.map2(arg)
+        return accumulate_all(call(arg) for call in self.summand_calls)
 
 
 # class MapBias(Map):
@@ -382,9 +420,17 @@ class MapComp(Map):
                          is_differentiable=map1.is_differentiable & map2.is_differentiable)
             self.map1 = map1
             self.map2 = map2
+            # Flatten nested compositions: factors are stored from the outermost to the innermost map.
+            self.factors = []
+            for map_ in (map1, map2):
+                self.factors.extend(map_.factors if isinstance(map_, MapComp) else [map_])
+            # Bound evaluation methods, in evaluation order (innermost map first).
+            self.factor_calls = [map_.__call__ for map_ in reversed(self.factors)]
 
     def __call__(self, arg: Union[Number, np.ndarray]) -> Union[Number, np.ndarray]:
-        return self.map1(self.map2(arg))
+        for call in self.factor_calls:
+            arg = call(arg)
+        return arg
 
 
 class DifferentiableMap(Map):
@@ -569,7 +615,7 @@ class DiffMapShifted(MapShifted, DifferentiableMap):
                                    diff_lipschitz_cst=self.map.diff_lipschitz_cst)
 
     def jacobianT(self, arg: Union[Number, np.ndarray]) -> 'LinearOperator':
-        return self.map.jacobianT(arg + self.shift)
+        return self.map.jacobianT(self.shifted(arg))
 
 
 class DiffMapSum(MapSum, DifferentiableMap):
@@ -580,7 +626,7 @@ class DiffMapSum(MapSum, DifferentiableMap):
                                    diff_lipschitz_cst=self.map1.diff_lipschitz_cst + self.map2.diff_lipschitz_cst)
 
     def jacobianT(self, arg: Union[Number, np.ndarray]) -> 'LinearOperator':
-        return self.map1.jacobianT(arg) + self.map2.jacobianT(arg)
+        return accumulate_all(map_.jacobianT(arg) for map_ in self.summands)
 
 
 # class DiffMapBias(MapBias, DifferentiableMap):
@@ -676,6 +722,10 @@ class MapStack(Map):
        >>> parH = MapStack(K1,K2, axis=1, n_jobs=-1)
        >>> np.allclose(H(np.concatenate((x,y))), parH(np.concatenate((x,y))))
        True
+       >>> MapStack(K1, K3, axis=2)
+       Traceback (most recent call last):
+           ...
+       ValueError: Axis must be one of {0, 1,-1}.
 
     See Also
     --------
@@ -701,7 +751,7 @@ class MapStack(Map):
         """
         self.maps = list(maps)
         if (np.abs(axis) > 1):
-            ValueError('Axis must be one of {0, 1,-1}.')
+            raise ValueError('Axis must be one of {0, 1,-1}.')
         self.axis = int(axis)
         self.is_linear_list = [map_.is_linear for map_ in self.maps]
         self.is_differentiable_list = [map_.is_differentiable for map_ in self.maps]
@@ -714,41 +764,43 @@ class MapStack(Map):
         if not self.is_valid_stack():
             raise ValueError('Inconsistent map shapes for  stacking.')
         Map.__init__(self, shape=self.get_shape(),
-                     is_linear=bool(np.prod(self.is_linear_list).astype(bool)),
-                     is_differentiable=bool(np.prod(self.is_differentiable_list).astype(bool)))
+                     is_linear=all(self.is_linear_list),
+                     is_differentiable=all(self.is_differentiable_list))
 
     def __call__(self, x: Union[Number, np.ndarray]) -> Union[Number, np.ndarray]:
         if self.axis == 0:
             if self.n_jobs == 1:
-                out_list = [map_.__call__(x).flatten() for map_ in self.maps]
+                out_list = [map_.__call__(x).ravel() for map_ in self.maps]
             else:
                 with job.Parallel(backend=self.joblib_backend, n_jobs=self.n_jobs, verbose=False) as parallel:
                     out_list = parallel(job.delayed(map_.__call__)(x) for map_ in self.maps)
-                out_list = [y.flatten() for y in out_list]
+                out_list = [y.ravel() for y in out_list]
             return np.concatenate(out_list, axis=0)
         else:
             x_split = np.split(x, self.sections)
             if self.n_jobs == 1:
                 result = 0
                 for i, map_ in enumerate(self.maps):
-                    result += map_.__call__(x_split[i])
+                    result = accumulate(result, map_.__call__(x_split[i]))
             else:
                 with job.Parallel(backend=self.joblib_backend, n_jobs=self.n_jobs, verbose=False) as parallel:
                     out_list = parallel(job.delayed(map_.__call__)(x_split[i])
                                         for i, map_ in enumerate(self.maps))
-                    result = np.sum(np.stack(out_list, axis=0), axis=0)
+                result = 0
+                for out in out_list:
+                    result = accumulate(result, out)
             return result
 
     def is_valid_stack(self) -> bool:
         col_sizes = [map_.shape[1 - self.axis] for map_ in self.maps]
-        return np.unique(col_sizes).size == 1
+        return len(set(col_sizes)) == 1
 
     def get_shape(self) -> Tuple[int, int]:
         sizes = [map_.shape[self.axis] for map_ in self.maps]
         if self.axis == 0:
-            return (int(np.sum(sizes).astype(int)), self.maps[0].shape[1 - self.axis])
+            return (int(sum(sizes)), self.maps[0].shape[1 - self.axis])
         else:
-            return (self.maps[0].shape[1 - self.axis], int(np.sum(sizes).astype(int)))
+            return (self.maps[0].shape[1 - self.axis], int(sum(sizes)))
 
 
 class MapVStack(MapStack):
@@ -127,11 +127,11 @@ class ExplicitLinearFunctional(LinearFunctional):
     """
 
     def __init__(self, vec: np.ndarray, dtype: type = np.float64):
-        self.vec = vec.flatten().astype(dtype)
+        self.vec = vec.flatten().astype(dtype, copy=False)
         super(ExplicitLinearFunctional, self).__init__(dim=vec.size, dtype=dtype, is_explicit=True)
 
     def __call__(self, x: np.ndarray) -> np.ndarray:
-        return np.dot(self.vec, x.flatten())
+        return np.dot(self.vec, x.ravel())
 
     def adjoint(self, y: Number) -> Number:
         return y * self.vec
@@ -658,8 +658,8 @@ class KLDivergence(ProximableFunctional):
 
     def __call__(self, x: Union[Number, np.ndarray]) -> Number:
         z = 0 * x + np.infty
-        z[(x > 0) * (self.data > 0)] = self.data[(x > 0) * (self.data > 0)] * np.log(
-            self.data[(x > 0) * (self.data > 0)] / x[(x > 0) * (self.data > 0)])
+        positive = (x > 0) * (self.data > 0)
+        z[positive] = self.data[positive] * np.log(self.data[positive] / x[positive])
         z[(x == 0) * (self.data >= 0)] = 0
         return np.sum(z - self.data + x)
 
@@ -299,11 +299,12 @@ class SquaredL1Norm(ProximableFunctional):
         """
         if self.prox_computation == 'root':
             if np.linalg.norm(x) > 0:
-                mu_max = np.max(np.abs(x) ** 2) / (4 * tau)
+                abs_x = np.abs(x)
+                mu_max = np.max(abs_x ** 2) / (4 * tau)
                 mu_min = 1e-12
-                func = lambda mu: np.sum(np.clip(np.abs(x) * np.sqrt(tau / mu) - 2 * tau, a_min=0, a_max=None)) - 1
+                func = lambda mu: np.sum(np.clip(abs_x * np.sqrt(tau / mu) - 2 * tau, a_min=0, a_max=None)) - 1
                 mu_star = sciop.brentq(func, a=mu_min, b=mu_max)
-                lambda_ = np.clip(np.abs(x) * np.sqrt(tau / mu_star) - 2 * tau, a_min=0, a_max=None)
+                lambda_ = np.clip(abs_x * np.sqrt(tau / mu_star) - 2 * tau, a_min=0, a_max=None)
                 return lambda_ * x / (lambda_ + 2 * tau)
             else:
                 return x
@@ -818,7 +819,8 @@ class LogBarrier(ProximableFunctional):
 
     def __call__(self, x: Union[Number, np.ndarray]) -> Number:
         y = 0 * x - np.infty
-        y[x > 0] = np.log(x[x > 0])
+        positive = x > 0
+        y[positive] = np.log(x[positive])
         return - y.sum()
 
     def prox(self, x: Union[Number, np.ndarray], tau: Number) -> Union[Number, np.ndarray]:
@@ -899,7 +901,8 @@ class ShannonEntropy(ProximableFunctional):
     def __call__(self, x: Union[Number, np.ndarray]) -> Number:
         y = 0 * x + np.infty
         y[x == 0] = 0
-        y[x > 0] = x[x > 0] * np.log(x[x > 0])
+        positive = x > 0
+        y[positive] = x[positive] * np.log(x[positive])
         return y.sum()
 
     def prox(self, x: Union[Number, np.ndarray], tau: Number) -> Union[Number, np.ndarray]:
@@ -19,6 +19,7 @@ from scipy import sparse as sparse
 
 from pycsou.core.linop import LinearOperator
 from pycsou.core.map import DiffMapStack
+from pycsou.util.misc import accumulate
 
 
 class PyLopLinearOperator(LinearOperator):
@@ -83,6 +84,7 @@ class ExplicitLinearOperator(LinearOperator):
                                                      is_dask=is_dask, is_dense=is_dense, is_sparse=is_sparse,
                                                      is_symmetric=is_symmetric)
         self.mat = array
+        self.is_complex = np.iscomplexobj(array)
 
     def __call__(self, x: Union[Number, np.ndarray, da.core.Array]) -> Union[Number, np.ndarray]:
         if self.is_dask:
@@ -94,9 +96,49 @@ class ExplicitLinearOperator(LinearOperator):
     def adjoint(self, y: Union[Number, np.ndarray, da.core.Array]) -> Union[Number, np.ndarray]:
         if self.is_dask:
             y = da.from_array(y) if not isinstance(y, da.core.Array) else y
-            return (self.mat.conj().transpose().dot(y)).compute()
+            if self.is_complex:
+                return (self.mat.transpose().dot(y.conj())).conj().compute()
+            return (self.mat.transpose().dot(y)).compute()
         else:
-            return self.mat.conj().transpose().dot(y)
+            if self.is_complex:
+                return np.conj(self.mat.transpose().dot(np.conj(y)))
+            return self.mat.transpose().dot(y)
+
+    def apply_along_axis(self, arr: np.ndarray, axis: int = 0) -> np.ndarray:
+        if self.is_dask:
+            return super(ExplicitLinearOperator, self).apply_along_axis(arr, axis=axis)
+        if arr.shape[axis] != self.shape[1]:
+            raise ValueError(
+                f"Array size along specified axis and the map domain's dimension differ: {arr.shape[axis]} != {self.shape[1]}.")
+        arr = np.moveaxis(arr, axis, 0)
+        out = np.asarray(self.mat.dot(arr.reshape(arr.shape[0], -1)))
+        return np.moveaxis(out.reshape((self.shape[0],) + arr.shape[1:]), 0, axis)
+
+    def rmatmat(self, arr: np.ndarray) -> np.ndarray:
+        if self.is_dask:
+            return super(ExplicitLinearOperator, self).rmatmat(arr)
+        arr = arr.reshape(self.shape[0], -1)
+        if self.is_complex:
+            return np.conj(np.asarray(self.mat.transpose().dot(np.conj(arr))))
+        return np.asarray(self.mat.transpose().dot(arr))
+
+    def todense(self) -> 'DenseLinearOperator':
+        if self.is_dense:
+            mat = self.mat.copy()
+        elif self.is_sparse:
+            mat = self.mat.toarray()
+        else:
+            mat = self.mat.compute()
+        return DenseLinearOperator(mat, is_symmetric=self.is_symmetric)
+
+    def tosparse(self) -> 'SparseLinearOperator':
+        if self.is_sparse:
+            mat = self.mat.copy()
+        elif self.is_dense:
+            mat = sparse.csr_matrix(self.mat)
+        else:
+            mat = sparse.csr_matrix(self.mat.compute())
+        return SparseLinearOperator(mat, is_symmetric=self.is_symmetric)
 
 
 class DenseLinearOperator(ExplicitLinearOperator):
@@ -262,11 +304,11 @@ class LinOpStack(LinearOperator, DiffMapStack):
         self.is_dask_list = [linop.is_dask for linop in self.linops]
         self.is_symmetric_list = [linop.is_symmetric for linop in self.linops]
         LinearOperator.__init__(self, shape=self.shape,
-                                is_explicit=bool(np.prod(self.is_explicit_list).astype(bool)),
-                                is_dense=bool(np.prod(self.is_dense_list).astype(bool)),
-                                is_sparse=bool(np.prod(self.is_sparse_list).astype(bool)),
-                                is_dask=bool(np.prod(self.is_dask_list).astype(bool)),
-                                is_symmetric=bool(np.prod(self.is_symmetric_list).astype(bool)),
+                                is_explicit=all(self.is_explicit_list),
+                                is_dense=all(self.is_dense_list),
+                                is_sparse=all(self.is_sparse_list),
+                                is_dask=all(self.is_dask_list),
+                                is_symmetric=all(self.is_symmetric_list),
                                 lipschitz_cst=self.lipschitz_cst)
 
     def adjoint(self, y: Union[Number, np.ndarray]) -> Union[Number, np.ndarray]:
@@ -275,20 +317,22 @@ class LinOpStack(LinearOperator, DiffMapStack):
             if self.n_jobs == 1:
                 result = 0
                 for i, linop in enumerate(self.linops):
-                    result += linop.adjoint(y_split[i])
+                    result = accumulate(result, linop.adjoint(y_split[i]))
             else:
                 with job.Parallel(backend=self.joblib_backend, n_jobs=self.n_jobs, verbose=False) as parallel:
                     out_list = parallel(job.delayed(linop.adjoint)(y_split[i])
                                         for i, linop in enumerate(self.linops))
-                    result = np.sum(np.stack(out_list, axis=0), axis=0)
+                result = 0
+                for out in out_list:
+                    result = accumulate(result, out)
             return result
         else:
             if self.n_jobs == 1:
-                out_list = [linop.adjoint(y).flatten() for linop in self.linops]
+                out_list = [linop.adjoint(y).ravel() for linop in self.linops]
             else:
                 with job.Parallel(backend=self.joblib_backend, n_jobs=self.n_jobs, verbose=False) as parallel:
                     out_list = parallel(job.delayed(linop.adjoint)(y) for linop in self.linops)
-                out_list = [y.flatten() for y in out_list]
+                out_list = [y.ravel() for y in out_list]
             return np.concatenate(out_list, axis=0)
 
 
@@ -564,7 +608,7 @@ class DiagonalOperator(LinearOperator):
         super(DiagonalOperator, self).__init__(shape=(self.diag.size, self.diag.size), dtype=self.diag.dtype,
                                                is_explicit=False, is_dense=False, is_sparse=False, is_dask=False,
                                                is_symmetric=np.alltrue(np.isreal(self.diag)))
-        self.lipschitz_cst = self.diff_lipschitz_cst = np.max(diag)
+        self.lipschitz_cst = self.diff_lipschitz_cst = np.max(np.abs(self.diag))
 
     def __call__(self, x: Union[Number, np.ndarray]) -> Union[Number, np.ndarray]:
         if self.shape[1] == 1:
@@ -578,6 +622,17 @@ class DiagonalOperator(LinearOperator):
         else:
             return self.diag.conj() * y
 
+    def compute_lipschitz_cst(self, **kwargs: dict):
+        self.lipschitz_cst = self.diff_lipschitz_cst = np.max(np.abs(self.diag))
+
+    def todense(self) -> DenseLinearOperator:
+        diag = np.broadcast_to(self.diag, (self.shape[0],))
+        return DenseLinearOperator(np.diag(diag), is_symmetric=self.is_symmetric)
+
+    def tosparse(self) -> SparseLinearOperator:
+        diag = np.broadcast_to(self.diag, (self.shape[0],))
+        return SparseLinearOperator(sparse.diags(diag, format='csr'), is_symmetric=self.is_symmetric)
+
 
 class IdentityOperator(DiagonalOperator):
     r"""
@@ -615,6 +670,15 @@ class NullOperator(LinearOperator):
     def adjoint(self, y: Union[Number, np.ndarray]) -> Union[Number, np.ndarray]:
         return np.zeros(shape=self.shape[1], dtype=self.dtype)
 
+    def compute_lipschitz_cst(self, **kwargs: dict):
+        self.lipschitz_cst = self.diff_lipschitz_cst = 0
+
+    def todense(self) -> DenseLinearOperator:
+        return DenseLinearOperator(np.zeros(shape=self.shape, dtype=self.dtype), is_symmetric=self.is_symmetric)
+
+    def tosparse(self) -> SparseLinearOperator:
+        return SparseLinearOperator(sparse.csr_matrix(self.shape, dtype=self.dtype), is_symmetric=self.is_symmetric)
+
     def eigenvals(self, k: int, which='LM', **kwargs) -> np.ndarray:
         return np.zeros(shape=(k,), dtype=self.dtype)
 
@@ -627,7 +691,17 @@ class HomothetyMap(DiagonalOperator):
         self.cst = constant
         super(HomothetyMap, self).__init__(diag=self.cst)
         self.shape = (size, size)
-        self.lipschitz_cst = self.diff_lipschitz_cst = constant
+        self.lipschitz_cst = self.diff_lipschitz_cst = np.abs(constant)
+
+    def __call__(self, x: Union[Number, np.ndarray]) -> Union[Number, np.ndarray]:
+        if self.shape[1] == 1:
+            return DiagonalOperator.__call__(self, x)
+        return self.cst * x
+
+    def adjoint(self, y: Union[Number, np.ndarray]) -> Union[Number, np.ndarray]:
+        if self.shape[0] == 1:
+            return DiagonalOperator.adjoint(self, y)
+        return np.conj(self.cst) * y
 
     def jacobianT(self, arg: Optional[Number] = None) -> Number:
         return self.cst
@@ -681,7 +755,7 @@ class PolynomialLinearOperator(LinearOperator):
         coeffs: Union[np.ndarray, list, tuple]
             Coefficients :math:`\{a_0,\ldots, a_N\}` of the polynomial :math:`P`.
         """
-        self.coeffs = np.asarray(coeffs).astype(LinOp.dtype)
+        self.coeffs = np.asarray(coeffs, dtype=LinOp.dtype)
         if LinOp.shape[0] != LinOp.shape[1]:
             raise ValueError('Input linear operator must be square.')
         else:
@@ -693,7 +767,7 @@ class PolynomialLinearOperator(LinearOperator):
                                                        is_symmetric=LinOp.is_symmetric)
 
     def __call__(self, x: Union[Number, np.ndarray]) -> Union[Number, np.ndarray]:
-        z = x.astype(self.dtype)
+        z = x.astype(self.dtype, copy=False)
         y = self.coeffs[0] * x
         for i in range(1, len(self.coeffs)):
             z = self.Linop(z)
@@ -704,7 +778,7 @@ class PolynomialLinearOperator(LinearOperator):
         if self.is_symmetric:
             return self(x)
         else:
-            z = x.astype(self.dtype)
+            z = x.astype(self.dtype, copy=False)
             y = np.conj(self.coeffs[0]) * x
             for i in range(1, len(self.coeffs)):
                 z = self.Linop.adjoint(z)
@@ -791,12 +865,18 @@ class KroneckerProduct(LinearOperator):
     def __call__(self, x: np.ndarray) -> np.ndarray:
         X = x.reshape((self.linop2.shape[1], self.linop1.shape[1]))
         return self.linop2.apply_along_axis(self.linop1.apply_along_axis(X.transpose(), axis=0).transpose(),
-                                            axis=0).flatten()
+                                            axis=0).ravel()
 
     def adjoint(self, y: np.ndarray) -> np.ndarray:
         Y = y.reshape((self.linop2.shape[0], self.linop1.shape[0]))
         return self.linop2.H.apply_along_axis(self.linop1.H.apply_along_axis(Y.transpose(), axis=0).transpose(),
-                                              axis=0).flatten()
+                                               axis=0).ravel()
+
+    def compute_lipschitz_cst(self, **kwargs: dict):
+        for linop in (self.linop1, self.linop2):
+            if linop.lipschitz_cst == np.infty:
+                linop.compute_lipschitz_cst(**kwargs)
+        self.lipschitz_cst = self.diff_lipschitz_cst = self.linop1.lipschitz_cst * self.linop2.lipschitz_cst
 
     @property
     def PinvOp(self) -> 'KroneckerProduct':
@@ -877,13 +957,13 @@ class KroneckerSum(LinearOperator):
 
     def __call__(self, x: np.ndarray) -> np.ndarray:
         X = x.reshape((self.linop2.shape[1], self.linop1.shape[1]))
-        return self.linop1.apply_along_axis(X.transpose(), axis=0).transpose().flatten() + \
-               self.linop2.apply_along_axis(X, axis=0).flatten()
+        return self.linop1.apply_along_axis(X.transpose(), axis=0).transpose().ravel() + \
+               self.linop2.apply_along_axis(X, axis=0).ravel()
 
     def adjoint(self, y: np.ndarray) -> np.ndarray:
         Y = y.reshape((self.linop2.shape[0], self.linop1.shape[0]))
-        return self.linop1.H.apply_along_axis(Y.transpose(), axis=0).transpose().flatten() + \
-               self.linop2.H.apply_along_axis(Y, axis=0).flatten()
+        return self.linop1.H.apply_along_axis(Y.transpose(), axis=0).transpose().ravel() + \
+               self.linop2.H.apply_along_axis(Y, axis=0).ravel()
 
 
 class KhatriRaoProduct(LinearOperator):
@@ -986,7 +1066,7 @@ class KhatriRaoProduct(LinearOperator):
         else:
             return np.diag(
                 self.linop2.H.apply_along_axis(self.linop1.H.apply_along_axis(Y.transpose(), axis=0).transpose(),
-                                               axis=0)).flatten()
+                                                axis=0)).flatten()
 
 
 if __name__ == '__main__':
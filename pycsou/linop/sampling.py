@@ -527,7 +527,7 @@ class Pooling(LinearOperator):
                             func_kwargs=self.pooling_func_kwargs).reshape(-1)
 
     def adjoint(self, y: np.ndarray) -> np.ndarray:
-        x = np.copy(y.reshape(self.output_shape))
+        x = y.reshape(self.output_shape)
         for ax in range(len(self.input_shape)):
             x = np.repeat(x, self.block_size[ax], axis=ax)
             x = np.swapaxes(x, 0, ax)
@@ -751,7 +751,7 @@ class GeneralisedVandermonde(DenseLinearOperator):
         """
         self.samples = samples.reshape(-1)
         self.funcs = list(funcs)
-        gen_vandermonde_mat = self.get_generalised_vandermonde_matrix().astype(dtype)
+        gen_vandermonde_mat = self.get_generalised_vandermonde_matrix().astype(dtype, copy=False)
         super(GeneralisedVandermonde, self).__init__(ndarray=gen_vandermonde_mat, is_symmetric=False)
 
     def _map_func(self, f: Callable) -> np.ndarray:
@@ -936,13 +936,15 @@ class MappedDistanceMatrix(ExplicitLinearOperator):
         Raises
         ------
         ValueError
-            If ``mode`` is invalid or if ``operator_type`` is ``'sparse'`` but ``max_distance=None``.
+            If ``mode`` or ``operator_type`` is invalid, or if ``operator_type`` is ``'sparse'`` but ``max_distance=None``.
 
         """
 
         if mode not in ['radial', 'zonal']:
             raise ValueError('Supported modes are "radial" or "zonal".')
-        if (operator_type is 'sparse') and (max_distance is None):
+        if operator_type not in ['sparse', 'dask', 'dense']:
+            raise ValueError(f'Unsupported operator type {operator_type}.')
+        if (operator_type == 'sparse') and (max_distance is None):
             raise ValueError('Specify a maximal distance for sparse format.')
         self.max_distance = max_distance
         self.mode = mode
@@ -962,14 +964,8 @@ class MappedDistanceMatrix(ExplicitLinearOperator):
         self.joblib_backend = joblib_backend
         self.ord = ord
         self.eps = eps
-        if self.operator_type is 'sparse':
-            mapped_distance_matrix = self.get_sparse_mdm()
-        elif self.operator_type is 'dask':
-            mapped_distance_matrix = self.get_dask_mdm()
-        elif self.operator_type is 'dense':
-            mapped_distance_matrix = self.get_dense_mdm()
-        else:
-            raise ValueError(f'Unsupported operator type {self.operator_type}.')
+        mdm_builders = {'sparse': self.get_sparse_mdm, 'dask': self.get_dask_mdm, 'dense': self.get_dense_mdm}
+        mapped_distance_matrix = mdm_builders[self.operator_type]()
         super(MappedDistanceMatrix, self).__init__(array=mapped_distance_matrix, is_symmetric=self.is_symmetric)
 
     def get_sparse_mdm(self) -> sparse.csr_matrix:
@@ -1055,7 +1051,7 @@ class MappedDistanceMatrix(ExplicitLinearOperator):
         else:
             raise ValueError(f'Unsupported mode {self.mode}.')
         mapped_distance_matrix = self.function(distances)
-        return mapped_distance_matrix.astype(self.dtype)
+        return mapped_distance_matrix.astype(self.dtype, copy=False)
 
 
 if __name__ == '__main__':
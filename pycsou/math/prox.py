@@ -59,8 +59,10 @@ def sign(x: Union[np.ndarray, Number]) -> Union[np.ndarray, Number]:
 
     """
     x = np.asarray(x)
-    y = np.asarray(0 * x)
-    y[np.abs(x) != 0] = np.conj(x[np.abs(x) != 0]) / np.abs(x[np.abs(x) != 0])
+    abs_x = np.abs(x)
+    nonzero = abs_x != 0
+    y = np.zeros_like(x)
+    y[nonzero] = np.conj(x[nonzero]) / abs_x[nonzero]
     return y
 
 
@@ -155,11 +157,12 @@ def proj_l1_ball(x: np.ndarray, radius: Number) -> np.ndarray:
     --------
     :py:func:`~pycsou.func.penalty.L1Ball`, :py:func:`~pycsou.math.prox.proj_l2_ball`, :py:func:`~pycsou.math.prox.proj_linfty_ball`.
     """
-    if np.sum(np.abs(x)) <= radius:
+    abs_x = np.abs(x)
+    if np.sum(abs_x) <= radius:
         return x
     else:
-        mu_max = np.max(np.abs(x))
-        func = lambda mu: np.sum(np.clip(np.abs(x) - mu, a_min=0, a_max=None)) - radius
+        mu_max = np.max(abs_x)
+        func = lambda mu: np.sum(np.clip(abs_x - mu, a_min=0, a_max=None)) - radius
         mu_star = sciop.brentq(func, a=0, b=mu_max)
         return soft(x, mu_star)
 
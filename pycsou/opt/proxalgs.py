@@ -554,7 +554,7 @@ class AcceleratedProximalGradientDescent(GenericIterativeAlgorithm):
         else:
             self.x0 = self.initialize_iterate()
         objective_functional = self.F + self.G
-        init_iterand = {'iterand': self.x0, 'past_aux': 0 * self.x0, 'past_t': 1}
+        init_iterand = {'iterand': self.x0, 'past_aux': np.zeros_like(self.x0), 'past_t': 1}
         super(AcceleratedProximalGradientDescent, self).__init__(objective_functional=objective_functional,
                                                                  init_iterand=init_iterand,
                                                                  max_iter=max_iter, min_iter=min_iter,
@@ -1,2 +1,2 @@
-from pycsou.util.misc import is_range_broadcastable, range_broadcast_shape, peaks
+from pycsou.util.misc import is_range_broadcastable, range_broadcast_shape, accumulate, accumulate_all, peaks
 from pycsou.util.stats import P2Algorithm
\ No newline at end of file
@@ -8,7 +8,8 @@ r"""
 Miscellaneous functions.
 """
 
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Union, Iterable
+from numbers import Number
 import numpy as np
 import re
 
@@ -88,6 +89,91 @@ def range_broadcast_shape(shape1: Tuple[int, int], shape2: Tuple[int, int]) -> T
     return shape
 
 
+def accumulate(acc: Union[Number, np.ndarray], term: Union[Number, np.ndarray]) -> Union[Number, np.ndarray]:
+    r"""
+    Add ``term`` to the accumulator ``acc``, in place whenever possible.
+
+    Parameters
+    ----------
+    acc: Union[Number, np.ndarray]
+        Accumulator. Must be owned by the caller, since it may be overwritten.
+    term: Union[Number, np.ndarray]
+        Term to be added to the accumulator.
+
+    Returns
+    -------
+    Union[Number, np.ndarray]
+        The sum ``acc + term``.
+
+    Examples
+    --------
+
+    .. testsetup::
+
+       import numpy as np
+       from pycsou.util.misc import accumulate
+
+    .. doctest::
+
+       >>> acc = np.zeros(3)
+       >>> out = accumulate(acc, np.arange(3))
+       >>> out is acc, out
+       (True, array([0., 1., 2.]))
+       >>> accumulate(np.zeros(3, dtype=int), 0.5)
+       array([0.5, 0.5, 0.5])
+
+    Notes
+    -----
+    The addition is performed in place (i.e. without allocating a temporary array) if ``acc`` and ``term`` are Numpy
+    arrays with the same shape and ``acc`` can hold the result without upcasting. Otherwise, the sum ``acc + term`` is returned.
+    This is used to sum the outputs of many maps with a single output buffer.
+    """
+    if isinstance(acc, np.ndarray) and isinstance(term, np.ndarray) and acc.shape == term.shape \
+            and acc.dtype == np.result_type(acc, term):
+        return np.add(acc, term, out=acc)
+    else:
+        return acc + term
+
+
+
+def accumulate_all(terms: Iterable[Union[Number, np.ndarray]]) -> Union[Number, np.ndarray]:
+    r"""
+    Sum at least two terms into a single output buffer.
+
+    Parameters
+    ----------
+    terms: Iterable[Union[Number, np.ndarray]]
+        Terms to be summed. They are consumed one at a time, so that a generator only ever holds one term in memory.
+
+    Returns
+    -------
+    Union[Number, np.ndarray]
+        The sum of the terms.
+
+    Examples
+    --------
+
+    .. testsetup::
+
+       import numpy as np
+       from pycsou.util.misc import accumulate_all
+
+    .. doctest::
+
+       >>> accumulate_all(np.arange(3) * i for i in range(4))
+       array([ 0,  6, 12])
+
+    Notes
+    -----
+    The first two terms are added out of place, so that the result is owned by this function. The remaining terms are then
+    added to it with :py:func:`~pycsou.util.misc.accumulate`.
+    """
+    terms = iter(terms)
+    result = next(terms) + next(terms)
+    for term in terms:
+        result = accumulate(result, term)
+    return result
+
 def peaks(x: np.ndarray, y: np.ndarray) -> np.ndarray:
     r"""
     Matlab 2D peaks function.